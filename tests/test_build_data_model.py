@@ -0,0 +1,153 @@
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from wake.compiler.build_data_model import (
+    CompilationUnitBuildInfo,
+    ProjectBuild,
+    ProjectBuildInfo,
+    SourceUnitInfo,
+)
+from wake.compiler.solc_frontend import (
+    SolcInputOptimizerSettings,
+    SolcInputSettings,
+    SolcOutputError,
+    SolcOutputErrorSeverityEnum,
+    SolcOutputErrorTypeEnum,
+)
+from wake.core.solidity_version import SolidityVersion
+from wake.ir.reference_resolver import ReferenceResolver
+from wake.utils.interval_index import IntervalIndex
+
+CU_HASH = "ab" * 32
+
+
+def _build_info() -> ProjectBuildInfo:
+    return ProjectBuildInfo(
+        compilation_units={
+            CU_HASH: CompilationUnitBuildInfo(
+                errors=[
+                    SolcOutputError(
+                        type=SolcOutputErrorTypeEnum.WARNING,
+                        component="general",
+                        severity=SolcOutputErrorSeverityEnum.WARNING,
+                        message="Unused local variable.",
+                    )
+                ]
+            )
+        },
+        source_units_info={
+            "contracts/A.sol": SourceUnitInfo(
+                fs_path=Path("/project/contracts/A.sol"),
+                blake2b_hash=bytes(range(32)),
+            ),
+            "contracts/B.sol": SourceUnitInfo(
+                fs_path=Path("/project/contracts/B.sol"),
+                blake2b_hash=bytes(32),
+            ),
+        },
+        allow_paths=frozenset([Path("/project/lib")]),
+        exclude_paths=frozenset([Path("/project/node_modules"), Path("/project/lib")]),
+        include_paths=frozenset(),
+        settings=SolcInputSettings(
+            optimizer=SolcInputOptimizerSettings(enabled=True, runs=200)
+        ),
+        target_solidity_version=SolidityVersion.fromstring("0.8.20"),
+        wake_version="4.10.0",
+        incremental=True,
+    )
+
+
+def test_json_round_trip():
+    build_info = _build_info()
+    data = build_info.model_dump_json(by_alias=True)
+
+    assert ProjectBuildInfo.model_validate_json(data) == build_info
+
+
+def test_path_sets_serialized_sorted():
+    build_info = _build_info()
+    data = json.loads(build_info.model_dump_json(by_alias=True))
+
+    assert data["exclude_paths"] == ["/project/lib", "/project/node_modules"]
+    assert data["include_paths"] == []
+    assert ProjectBuildInfo.model_validate(data).exclude_paths == frozenset(
+        [Path("/project/node_modules"), Path("/project/lib")]
+    )
+
+    for invalid in ("/project/lib", 1, [1]):
+        with pytest.raises(ValidationError):
+            ProjectBuildInfo.model_validate({**data, "allow_paths": invalid})
+
+
+def test_load_trusted():
+    build_info = _build_info()
+    raw = json.loads(build_info.model_dump_json(by_alias=True))
+    loaded = ProjectBuildInfo.load_trusted(raw)
+
+    assert loaded == build_info
+    assert loaded.source_units_info["contracts/A.sol"].fs_path == Path(
+        "/project/contracts/A.sol"
+    )
+    assert loaded.source_units_info["contracts/A.sol"].blake2b_hash == bytes(range(32))
+    assert isinstance(loaded.compilation_units[CU_HASH].errors[0], SolcOutputError)
+    assert loaded.settings == build_info.settings
+
+
+def test_pickle_round_trip():
+    build_info = _build_info()
+    data = build_info.to_pickle_bytes()
+
+    raw = pickle.loads(data)
+    assert isinstance(
+        raw["source_units_info"]["contracts/A.sol"]["blake2b_hash"], bytes
+    )
+    assert ProjectBuildInfo.from_pickle_bytes(data) == build_info
+    assert ProjectBuildInfo.model_validate(pickle.loads(data)) == build_info
+
+
+def test_hex_bytes_validation():
+    info = SourceUnitInfo.model_validate(
+        {"fs_path": "/project/contracts/A.sol", "blake2b_hash": "00ff"}
+    )
+    assert info.blake2b_hash == b"\x00\xff"
+    assert info.fs_path == Path("/project/contracts/A.sol")
+    assert (
+        SourceUnitInfo(
+            fs_path=Path("/project/contracts/A.sol"), blake2b_hash=bytearray(b"\x01")
+        ).blake2b_hash
+        == b"\x01"
+    )
+
+    class BytesSubclass(bytes):
+        pass
+
+    assert (
+        SourceUnitInfo(
+            fs_path=Path("/project/contracts/A.sol"),
+            blake2b_hash=BytesSubclass(b"\x02"),
+        ).blake2b_hash
+        == b"\x02"
+    )
+
+    with pytest.raises(ValidationError):
+        SourceUnitInfo.model_validate(
+            {"fs_path": "/project/contracts/A.sol", "blake2b_hash": 1}
+        )
+    with pytest.raises(ValidationError):
+        SourceUnitInfo.model_validate({"fs_path": 1, "blake2b_hash": "00ff"})
+
+
+def test_project_build_pickle():
+    build = ProjectBuild(
+        interval_trees={}, reference_resolver=ReferenceResolver(), source_units={}
+    )
+    assert build.interval_trees is build.interval_trees
+
+    loaded = pickle.loads(pickle.dumps(build))
+    loaded._interval_trees[Path("/project/contracts/A.sol")] = IntervalIndex()
+    assert Path("/project/contracts/A.sol") in loaded.interval_trees
+    assert len(loaded.source_units) == 0
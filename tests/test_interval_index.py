@@ -0,0 +1,97 @@
+import pickle
+import random
+
+import pytest
+from intervaltree import Interval, IntervalTree
+
+from wake.utils.interval_index import IntervalIndex
+
+
+def _random_intervals(count: int, size: int):
+    rnd = random.Random(42)
+    ret = [(0, size, "root")]
+    for i in range(count):
+        begin = rnd.randrange(size - 1)
+        end = rnd.randrange(begin + 1, min(size, begin + rnd.choice((4, 64, 1024))) + 1)
+        ret.append((begin, end, i))
+    return ret
+
+
+def test_queries_match_interval_tree():
+    size = 5000
+    intervals = _random_intervals(2000, size)
+
+    tree = IntervalTree()
+    index = IntervalIndex()
+    for begin, end, data in intervals:
+        tree[begin:end] = data
+        index[begin:end] = data
+
+    assert len(index) == len(tree)
+    assert set(index) == set(tree)
+    assert index.begin() == tree.begin()
+    assert index.end() == tree.end()
+
+    rnd = random.Random(0)
+    for _ in range(500):
+        point = rnd.randrange(-10, size + 10)
+        assert index.at(point) == tree.at(point)
+        assert index[point] == tree[point]
+
+        begin = rnd.randrange(-10, size + 10)
+        end = begin + rnd.randrange(0, 200)
+        assert index.overlap(begin, end) == tree.overlap(begin, end)
+        assert index[begin:end] == tree[begin:end]
+        assert index.envelop(begin, end) == tree.envelop(begin, end)
+
+    assert index[:100] == tree[:100]
+    assert index[4900:] == tree[4900:]
+    assert index[:] == tree[:]
+
+
+def test_insert_after_query():
+    index = IntervalIndex()
+    index.addi(0, 10, "a")
+    assert {i.data for i in index.at(5)} == {"a"}
+
+    index.addi(4, 6, "b")
+    assert {i.data for i in index.at(5)} == {"a", "b"}
+
+
+def test_pickle():
+    index = IntervalIndex()
+    index[0:10] = "a"
+    index[2:3] = "b"
+    loaded = pickle.loads(pickle.dumps(index))
+
+    assert loaded.at(2) == index.at(2)
+
+
+def test_null_interval():
+    with pytest.raises(ValueError):
+        IntervalIndex().addi(5, 5)
+
+
+def test_set_semantics():
+    index = IntervalIndex()
+    index[0:10] = "a"
+    index[0:10] = "a"
+    index[4:6] = "b"
+
+    assert len(index) == 2
+    assert Interval(0, 10, "a") in index
+    assert index.containsi(4, 6, "b")
+    assert not index.containsi(4, 6)
+    assert index.overlaps(5)
+    assert index.overlaps(9, 20)
+    assert not index.overlaps(Interval(10, 20))
+
+    index.remove(Interval(4, 6, "b"))
+    assert {i.data for i in index.at(5)} == {"a"}
+    with pytest.raises(ValueError):
+        index.removei(4, 6, "b")
+    index.discardi(4, 6, "b")
+
+    assert index.items() == {Interval(0, 10, "a")}
+    assert index.span() == 10
+    assert IntervalIndex().is_empty()
@@ -23,6 +23,8 @@ async def compile(
     force: bool,
     watch: bool,
     incremental: Optional[bool],
+    trusted_cache: bool,
+    export_json: bool,
 ):
     from watchdog.observers import Observer
 
@@ -99,13 +101,14 @@ async def compile(
         observer = None
 
     if not force:
-        compiler.load(console=console)
+        compiler.load(console=console, trusted=trusted_cache)
 
     # TODO Allow choosing build artifacts subset in compile subcommand
     _, errors = await compiler.compile(
         sol_files,
         [SolcOutputSelectionEnum.ALL],
         write_artifacts=not no_artifacts,
+        export_json=export_json,
         force_recompile=force,
         console=console,
         no_warnings=no_warnings,
@@ -162,6 +165,18 @@ async def compile(
     default=None,
     help="Enforce incremental or non-incremental compilation.",
 )
+@click.option(
+    "--trusted-cache",
+    is_flag=True,
+    default=False,
+    help="Skip validation of previous build info when loading it.",
+)
+@click.option(
+    "--export-json",
+    is_flag=True,
+    default=False,
+    help="Also write human-readable build info to .wake/build/build.json.",
+)
 @click.option(
     "--allow-path",
     "allow_paths",
@@ -248,6 +263,8 @@ def run_compile(
     force: bool,
     watch: bool,
     incremental: Optional[bool],
+    trusted_cache: bool,
+    export_json: bool,
     allow_paths: Tuple[str],
     evm_version: Optional[str],
     exclude_paths: Tuple[str],
@@ -299,5 +316,15 @@ def run_compile(
     config.update({"compiler": {"solc": new_options}}, deleted_options)
 
     asyncio.run(
-        compile(config, paths, no_artifacts, no_warnings, force, watch, incremental)
+        compile(
+            config,
+            paths,
+            no_artifacts,
+            no_warnings,
+            force,
+            watch,
+            incremental,
+            trusted_cache,
+            export_json,
+        )
     )
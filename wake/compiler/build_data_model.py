@@ -1,43 +1,97 @@
+import pickle
+from os import PathLike
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, Dict, FrozenSet, List, Optional
-
-from intervaltree import IntervalTree
-from pydantic import (
-    BaseModel,
-    ConfigDict,
-    PlainSerializer,
-    PlainValidator,
-    WithJsonSchema,
-    errors,
-    field_serializer,
-)
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+from pydantic.config import ConfigDict
+from pydantic.functional_serializers import PlainSerializer, field_serializer
+from pydantic.functional_validators import PlainValidator
+from pydantic.json_schema import WithJsonSchema
+from pydantic.main import BaseModel
 from typing_extensions import Annotated
 
 from wake.compiler.solc_frontend import SolcInputSettings, SolcOutputError
 from wake.core.solidity_version import SolidityVersion
 from wake.ir import SourceUnit
 from wake.ir.reference_resolver import ReferenceResolver
+from wake.utils.interval_index import IntervalIndex
+
+_HEX_BYTES_CONVERTERS: Dict[type, Callable[[Any], bytes]] = {
+    bytes: lambda val: val,
+    bytearray: bytes,
+    str: bytes.fromhex,
+}
 
 
 def hex_bytes_validator(val: Any) -> bytes:
-    if isinstance(val, bytes):
-        return val
-    elif isinstance(val, bytearray):
-        return bytes(val)
-    elif isinstance(val, str):
-        return bytes.fromhex(val)
-    raise errors.BytesError()
+    try:
+        converter = _HEX_BYTES_CONVERTERS[type(val)]
+    except KeyError:
+        # subclasses (e.g. hexbytes.HexBytes) miss the exact type lookup
+        if isinstance(val, (bytes, bytearray)):
+            return bytes(val)
+        elif isinstance(val, str):
+            return bytes.fromhex(val)
+        raise ValueError(
+            f"Expected bytes or hex string, got {type(val).__name__}"
+        ) from None
+    return converter(val)
+
 
+_HEX_BYTES_VALIDATOR = PlainValidator(hex_bytes_validator)
+_HEX_BYTES_SERIALIZER = PlainSerializer(bytes.hex, when_used="json")
 
 HexBytes = Annotated[
     bytes,
-    PlainValidator(hex_bytes_validator),
-    PlainSerializer(lambda b: b.hex()),
+    _HEX_BYTES_VALIDATOR,
+    _HEX_BYTES_SERIALIZER,
     WithJsonSchema({"type": "string"}),
 ]
 
 
+def fs_path_validator(val: Any) -> Path:
+    # skips pydantic's str validation step preceding the Path conversion
+    if not isinstance(val, (str, PathLike)):
+        raise ValueError(f"Expected path or string, got {type(val).__name__}")
+    return Path(val)
+
+
+_FS_PATH_VALIDATOR = PlainValidator(fs_path_validator)
+_FS_PATH_SERIALIZER = PlainSerializer(str, when_used="json")
+
+FsPath = Annotated[
+    Path,
+    _FS_PATH_VALIDATOR,
+    _FS_PATH_SERIALIZER,
+    WithJsonSchema({"type": "string", "format": "path"}),
+]
+
+
+def fs_path_set_validator(val: Any) -> FrozenSet[Path]:
+    # a str is iterable, but would be split into single-character paths
+    if not isinstance(val, (list, tuple, set, frozenset)):
+        raise ValueError(f"Expected a collection of paths, got {type(val).__name__}")
+    # skips pydantic's per-item str and Path validation steps
+    return frozenset(map(fs_path_validator, val))
+
+
+def fs_path_set_serializer(val: FrozenSet[Path]) -> List[str]:
+    # sorted for deterministic output
+    return sorted(map(str, val))
+
+
+_FS_PATH_SET_VALIDATOR = PlainValidator(fs_path_set_validator)
+_FS_PATH_SET_SERIALIZER = PlainSerializer(fs_path_set_serializer, when_used="json")
+
+FsPathSet = Annotated[
+    FrozenSet[Path],
+    _FS_PATH_SET_VALIDATOR,
+    _FS_PATH_SET_SERIALIZER,
+    WithJsonSchema({"type": "array", "items": {"type": "string", "format": "path"}}),
+]
+
+
 class BuildInfoModel(BaseModel):
     model_config = ConfigDict(
         extra="allow",
@@ -65,7 +119,7 @@ class SourceUnitInfo(BuildInfoModel):
         blake2b_hash: 256-bit blake2b hash of the source unit contents.
     """
 
-    fs_path: Path
+    fs_path: FsPath
     blake2b_hash: HexBytes
 
 
@@ -85,9 +139,9 @@ class ProjectBuildInfo(BuildInfoModel):
 
     compilation_units: Dict[str, CompilationUnitBuildInfo]
     source_units_info: Dict[str, SourceUnitInfo]
-    allow_paths: FrozenSet[Path]
-    exclude_paths: FrozenSet[Path]
-    include_paths: FrozenSet[Path]
+    allow_paths: FsPathSet
+    exclude_paths: FsPathSet
+    include_paths: FsPathSet
     settings: SolcInputSettings
     target_solidity_version: Optional[SolidityVersion]
     wake_version: str
@@ -97,35 +151,110 @@ class ProjectBuildInfo(BuildInfoModel):
     def serialize_target_version(self, version: Optional[SolidityVersion], info):
         return str(version) if version is not None else None
 
+    @classmethod
+    def load_trusted(cls, raw: Dict[str, Any]) -> "ProjectBuildInfo":
+        """
+        Construct the build info from data previously serialized by Wake, skipping validation of source unit info entries.
+        Must not be used with data from untrusted sources.
+
+        Args:
+            raw: Build info dumped with `model_dump`, e.g. loaded from `.wake/build/build_info.bin`.
+
+        Returns:
+            Project build info.
+        """
+        target_version = raw["target_solidity_version"]
+        if isinstance(target_version, str):
+            target_version = SolidityVersion.fromstring(target_version)
+
+        return cls.model_construct(
+            compilation_units={
+                cu_hash: CompilationUnitBuildInfo.model_construct(
+                    errors=[SolcOutputError.model_validate(e) for e in cu["errors"]]
+                )
+                for cu_hash, cu in raw["compilation_units"].items()
+            },
+            source_units_info={
+                source_unit_name: SourceUnitInfo.model_construct(
+                    fs_path=Path(info["fs_path"]),
+                    blake2b_hash=hex_bytes_validator(info["blake2b_hash"]),
+                )
+                for source_unit_name, info in raw["source_units_info"].items()
+            },
+            allow_paths=fs_path_set_validator(raw["allow_paths"]),
+            exclude_paths=fs_path_set_validator(raw["exclude_paths"]),
+            include_paths=fs_path_set_validator(raw["include_paths"]),
+            settings=SolcInputSettings.model_validate(raw["settings"]),
+            target_solidity_version=target_version,
+            wake_version=raw["wake_version"],
+            incremental=raw["incremental"],
+        )
+
+    def to_pickle_bytes(self) -> bytes:
+        """
+        Returns:
+            Build info serialized with pickle, keeping paths and hashes in their native representation.
+        """
+        return pickle.dumps(self.model_dump(by_alias=True), protocol=5)
+
+    @classmethod
+    def from_pickle_bytes(cls, data: bytes) -> "ProjectBuildInfo":
+        """
+        Must only be used with data produced by [to_pickle_bytes][wake.compiler.build_data_model.ProjectBuildInfo.to_pickle_bytes] and verified to be trusted.
+
+        Args:
+            data: Serialized build info.
+
+        Returns:
+            Project build info.
+        """
+        return cls.load_trusted(pickle.loads(data))
+
 
 class ProjectBuild:
     """
     Class holding a single project build.
     """
 
-    _interval_trees: Dict[Path, IntervalTree]
+    _interval_trees: Dict[Path, IntervalIndex]
     _reference_resolver: ReferenceResolver
     _source_units: Dict[Path, SourceUnit]
+    _interval_trees_view: MappingProxyType
+    _source_units_view: MappingProxyType
 
     def __init__(
         self,
-        interval_trees: Dict[Path, IntervalTree],
+        interval_trees: Dict[Path, IntervalIndex],
         reference_resolver: ReferenceResolver,
         source_units: Dict[Path, SourceUnit],
     ):
         self._interval_trees = interval_trees
         self._reference_resolver = reference_resolver
         self._source_units = source_units
+        self._create_views()
+
+    def _create_views(self) -> None:
+        # read-only views reflect later changes to the underlying dicts
+        self._interval_trees_view = MappingProxyType(self._interval_trees)
+        self._source_units_view = MappingProxyType(self._source_units)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_interval_trees_view"]
+        del state["_source_units_view"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._create_views()
 
     @property
-    def interval_trees(self) -> Dict[Path, IntervalTree]:
+    def interval_trees(self) -> Dict[Path, IntervalIndex]:
         """
         Returns:
-            Mapping of source file paths to [interval trees](https://github.com/chaimleib/intervaltree) that can be used to query IR nodes by byte offsets in the source code.
+            Mapping of source file paths to [IntervalIndex][wake.utils.interval_index.IntervalIndex] instances that can be used to query IR nodes by byte offsets in the source code. Only a subset of the [IntervalTree](https://github.com/chaimleib/intervaltree) interface is implemented.
         """
-        return MappingProxyType(
-            self._interval_trees
-        )  # pyright: ignore reportGeneralTypeIssues
+        return self._interval_trees_view  # pyright: ignore reportGeneralTypeIssues
 
     @property
     def reference_resolver(self) -> ReferenceResolver:
@@ -141,6 +270,4 @@ class ProjectBuild:
         Returns:
             Mapping of source file paths to top-level [SourceUnit][wake.ir.meta.source_unit.SourceUnit] IR nodes.
         """
-        return MappingProxyType(
-            self._source_units
-        )  # pyright: ignore reportGeneralTypeIssues
+        return self._source_units_view  # pyright: ignore reportGeneralTypeIssues
@@ -32,7 +32,6 @@ import rich
 import rich.console
 import rich.panel
 from Crypto.Hash import BLAKE2b
-from intervaltree import IntervalTree
 from pathvalidate import sanitize_filename  # type: ignore
 from pydantic import ValidationError
 from rich.progress import Progress
@@ -70,6 +69,7 @@ from wake.svm import SolcVersionManager
 
 from ..utils import get_package_version
 from ..utils.file_utils import is_relative_to
+from ..utils.interval_index import IntervalIndex
 from ..utils.keyed_default_dict import KeyedDefaultDict
 from .build_data_model import (
     CompilationUnitBuildInfo,
@@ -691,7 +691,12 @@ class SolidityCompiler:
                     queue.append(to)
                     out.add(cu.source_unit_name_to_path(to))
 
-    def load(self, *, console: Optional[rich.console.Console] = None) -> None:
+    def load(
+        self,
+        *,
+        console: Optional[rich.console.Console] = None,
+        trusted: bool = False,
+    ) -> None:
         ctx_manager = (
             console.status("[bold green]Loading previous build...")
             if console is not None
@@ -702,18 +707,18 @@ class SolidityCompiler:
         with ctx_manager:
             try:
                 latest_build_path = self.__config.project_root_path / ".wake" / "build"
-                build_info = ProjectBuildInfo.parse_file(
-                    latest_build_path / "build.json"
-                )
-                build_data = (latest_build_path / "build.bin").read_bytes()
-
-                if build_info.wake_version != get_package_version("eth-wake"):
+                version_data = (latest_build_path / "build.version").read_bytes()
+                build_version = version_data.decode("utf-8")
+                if build_version != get_package_version("eth-wake"):
                     if console is not None:
                         console.log(
-                            f"[yellow]Wake version changed from {build_info.wake_version} to {get_package_version('eth-wake')} since the last build[/yellow]"
+                            f"[yellow]Wake version changed from {build_version} to {get_package_version('eth-wake')} since the last build[/yellow]"
                         )
                     return
 
+                build_info_data = (latest_build_path / "build_info.bin").read_bytes()
+                build_data = (latest_build_path / "build.bin").read_bytes()
+
                 build_key_path = self.__config.global_data_path / "build.key"
                 if not build_key_path.is_file():
                     if console is not None:
@@ -728,12 +733,25 @@ class SolidityCompiler:
                         )
                     return
 
-                build_sig = (latest_build_path / "build.bin.sig").read_bytes()
+                build_info_sig = (latest_build_path / "build_info.bin.sig").read_bytes()
+                h = BLAKE2b.new(digest_bits=512, key=build_key)
+                h.update(version_data)
+                h.update(build_info_data)
+                h.verify(build_info_sig)
 
+                build_sig = (latest_build_path / "build.bin.sig").read_bytes()
                 h = BLAKE2b.new(digest_bits=512, key=build_key)
+                h.update(version_data)
                 h.update(build_data)
                 h.verify(build_sig)
 
+                if trusted:
+                    build_info = ProjectBuildInfo.from_pickle_bytes(build_info_data)
+                else:
+                    build_info = ProjectBuildInfo.model_validate(
+                        pickle.loads(build_info_data)
+                    )
+
                 self._latest_build = pickle.loads(build_data)
                 self._latest_build_info = build_info
             except (
@@ -742,6 +760,8 @@ class SolidityCompiler:
                 ValidationError,
                 JSONDecodeError,
                 FileNotFoundError,
+                KeyError,
+                TypeError,
                 pickle.UnpicklingError,
                 ValueError,
             ):
@@ -808,6 +828,7 @@ class SolidityCompiler:
         output_types: Collection[SolcOutputSelectionEnum],
         *,
         write_artifacts: bool = True,
+        export_json: bool = False,
         force_recompile: bool = False,
         modified_files: Optional[Mapping[Path, bytes]] = None,
         deleted_files: Optional[
@@ -1102,7 +1123,7 @@ class SolidityCompiler:
                         source_unit_name in graph.nodes
                     ), f"Source unit {source_unit_name} not in graph"
 
-                    interval_tree = IntervalTree()
+                    interval_tree = IntervalIndex()
                     init = IrInitTuple(
                         path,
                         graph.nodes[source_unit_name]["content"],
@@ -1197,7 +1218,7 @@ class SolidityCompiler:
             len(compilation_units) > 0 or len(deleted_files) > 0 or force_recompile
         ):
             logger.debug("Writing artifacts")
-            self.write_artifacts(console=console)
+            self.write_artifacts(console=console, export_json=export_json)
 
             self.__config.project_root_path.joinpath(
                 ".wake/build/symbols.json"
@@ -1261,7 +1282,10 @@ class SolidityCompiler:
         return build, errors
 
     def write_artifacts(
-        self, *, console: Optional[rich.console.Console] = None
+        self,
+        *,
+        console: Optional[rich.console.Console] = None,
+        export_json: bool = False,
     ) -> None:
         if self._latest_build_info is None or self._latest_build is None:
             raise Exception("Project not compiled yet")
@@ -1285,14 +1309,34 @@ class SolidityCompiler:
             build_path = self.__config.project_root_path / ".wake" / "build"
             build_path.mkdir(parents=True, exist_ok=True)
 
-            with (build_path / "build.json").open("w") as f:
-                f.write(self._latest_build_info.model_dump_json(by_alias=True))
+            if export_json:
+                with (build_path / "build.json").open("w") as f:
+                    f.write(self._latest_build_info.model_dump_json(by_alias=True))
+            else:
+                # do not leave behind a stale export from a previous build
+                (build_path / "build.json").unlink(missing_ok=True)
+
+            # not pickled, so load() can reject other Wake versions before unpickling
+            version_data = self._latest_build_info.wake_version.encode("utf-8")
+            (build_path / "build.version").write_bytes(version_data)
+
+            with (build_path / "build_info.bin").open("wb") as data_file, (
+                build_path / "build_info.bin.sig"
+            ).open("wb") as sig_file:
+                build_info_data = self._latest_build_info.to_pickle_bytes()
+                h = BLAKE2b.new(digest_bits=512, key=build_key)
+                h.update(version_data)
+                h.update(build_info_data)
+
+                data_file.write(build_info_data)
+                sig_file.write(h.digest())
 
             with (build_path / "build.bin").open("wb") as data_file, (
                 build_path / "build.bin.sig"
             ).open("wb") as sig_file:
                 build_data = pickle.dumps(self._latest_build)
                 h = BLAKE2b.new(digest_bits=512, key=build_key)
+                h.update(version_data)
                 h.update(build_data)
 
                 data_file.write(build_data)
@@ -355,20 +355,20 @@ class Chain(wake.development.core.Chain):
         )
 
         with ctx_manager as status:
-            while tx.status == TransactionStatusEnum.PENDING:
+            while tx._fetch_status() == TransactionStatusEnum.PENDING:
                 time.sleep(0.5)
                 if status is not None:
                     status.update(get_pending_text())
 
+        block_number = tx.block_number
+
         if not config.deployment.silent:
             if tx.chain.chain_id in chain_explorer_urls:
                 console.print(
-                    f"Transaction [link={chain_explorer_urls[tx.chain.chain_id].url}/tx/{tx.tx_hash}]{tx.tx_hash}[/link] mined in block {tx.block_number}"
+                    f"Transaction [link={chain_explorer_urls[tx.chain.chain_id].url}/tx/{tx.tx_hash}]{tx.tx_hash}[/link] mined in block {block_number}"
                 )
             else:
-                console.print(
-                    f"Transaction {tx.tx_hash} mined in block {tx.block_number}"
-                )
+                console.print(f"Transaction {tx.tx_hash} mined in block {block_number}")
 
         latest_block_number = self.chain_interface.get_block_number()
 
@@ -389,15 +389,15 @@ class Chain(wake.development.core.Chain):
                 task_id = progress.add_task(
                     "Confirmations",
                     total=confirmations,
-                    completed=(latest_block_number - tx.block_number + 1),
+                    completed=(latest_block_number - block_number + 1),
                 )
-            while latest_block_number - tx.block_number < confirmations - 1:
+            while latest_block_number - block_number < confirmations - 1:
                 time.sleep(1)
                 latest_block_number = self.chain_interface.get_block_number()
                 if progress is not None:
                     progress.update(
                         task_id,  # pyright: ignore reportUnboundVariable
-                        completed=(latest_block_number - tx.block_number + 1),
+                        completed=(latest_block_number - block_number + 1),
                     )
 
     def _confirm_transaction(self, tx: TxParams) -> None:
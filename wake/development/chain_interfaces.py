@@ -3,8 +3,8 @@ from __future__ import annotations
 import subprocess
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
-from urllib.error import URLError
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from urllib.error import HTTPError, URLError
 
 from typing_extensions import Literal, TypedDict
 
@@ -12,7 +12,10 @@ from wake.cli.console import console
 from wake.config import WakeConfig
 from wake.utils.networking import get_free_port
 
-from .json_rpc.communicator import JsonRpcCommunicator
+from .json_rpc.communicator import JsonRpcCommunicator, JsonRpcError
+
+if TYPE_CHECKING:
+    from .transactions import TransactionAbc
 
 TxParams = TypedDict(
     "TxParams",
@@ -521,6 +524,16 @@ class ChainInterfaceAbc(ABC):
     def mine_many(self, num_blocks: int, timestamp_change: Optional[int]) -> None:
         ...
 
+    # Transaction output extraction differs between clients. Implementations must only use
+    # the TransactionAbc._output_from_* helpers, which share the transaction's cached traces.
+    @abstractmethod
+    def _extract_return_data(self, tx: TransactionAbc) -> bytes:
+        ...
+
+    @abstractmethod
+    def _extract_revert_data(self, tx: TransactionAbc) -> bytes:
+        ...
+
 
 class HardhatChainInterface(ChainInterfaceAbc):
     def get_accounts(self) -> List[str]:
@@ -592,6 +605,12 @@ class HardhatChainInterface(ChainInterfaceAbc):
     def hardhat_metadata(self) -> Dict[str, Any]:
         return self._communicator.send_request("hardhat_metadata")
 
+    def _extract_return_data(self, tx: TransactionAbc) -> bytes:
+        return tx._output_from_debug_trace()
+
+    def _extract_revert_data(self, tx: TransactionAbc) -> bytes:
+        return tx._output_from_debug_trace()
+
 
 class AnvilChainInterface(ChainInterfaceAbc):
     def get_accounts(self) -> List[str]:
@@ -659,6 +678,15 @@ class AnvilChainInterface(ChainInterfaceAbc):
             else [hex(num_blocks)],
         )
 
+    def _extract_return_data(self, tx: TransactionAbc) -> bytes:
+        return tx._output_from_trace()
+
+    def _extract_revert_data(self, tx: TransactionAbc) -> bytes:
+        # due to a bug, Anvil does not return revert data for failed contract creations
+        if tx.to is not None:
+            return tx._output_from_trace()
+        return tx._output_from_struct_logs("REVERT")
+
 
 class GanacheChainInterface(ChainInterfaceAbc):
     def get_accounts(self) -> List[str]:
@@ -730,6 +758,12 @@ class GanacheChainInterface(ChainInterfaceAbc):
             [{"blocks": num_blocks}],
         )
 
+    def _extract_return_data(self, tx: TransactionAbc) -> bytes:
+        return tx._output_from_struct_logs("RETURN")
+
+    def _extract_revert_data(self, tx: TransactionAbc) -> bytes:
+        return tx._output_from_struct_logs("REVERT")
+
 
 class GethLikeChainInterfaceAbc(ChainInterfaceAbc, ABC):
     @property
@@ -792,6 +826,25 @@ class GethLikeChainInterfaceAbc(ChainInterfaceAbc, ABC):
     def mine_many(self, num_blocks: int, timestamp_change: Optional[int]) -> None:
         raise NotImplementedError(f"{self._name} does not support mining blocks")
 
+    def _extract_output(self, tx: TransactionAbc, description: str) -> bytes:
+        try:
+            return tx._output_from_trace()
+        except (JsonRpcError, HTTPError):
+            # TODO make assertions about error.code?
+            try:
+                return tx._output_from_debug_trace()
+            except (JsonRpcError, HTTPError):
+                # TODO make assertions about error.code?
+                raise RuntimeError(
+                    f"Could not get {description} for transaction {tx.tx_hash} as trace_transaction and debug_trace_transaction are both unavailable"
+                )
+
+    def _extract_return_data(self, tx: TransactionAbc) -> bytes:
+        return self._extract_output(tx, "return value")
+
+    def _extract_revert_data(self, tx: TransactionAbc) -> bytes:
+        return self._extract_output(tx, "revert reason data")
+
 
 class GethChainInterface(GethLikeChainInterfaceAbc):
     @property
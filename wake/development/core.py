@@ -1429,6 +1429,7 @@ def check_connected(f):
 
 _private_keys_index: Dict[Address, bytes] = {}
 _test_accounts_generated_count: int = 0
+TX_OUTPUTS_CACHE_SIZE = 1024
 
 
 class Chain(ABC):
@@ -1455,6 +1456,8 @@ class Chain(ABC):
     _forked_chain_id: Optional[int]
     _debug_trace_call_supported: bool
     _client_version: str
+    # (tx_hash, block_hash, kind) -> processed events/console logs, in LRU order
+    _tx_outputs_cache: Dict[Tuple[str, str, str], tuple]
 
     tx_callback: Optional[Callable[[TransactionAbc], None]]
 
@@ -1701,6 +1704,7 @@ class Chain(ABC):
             from .transactions import ChainTransactions
 
             self._txs = ChainTransactions(self)
+            self._tx_outputs_cache = {}
 
             self._accounts = [
                 Account(acc, self) for acc in self._chain_interface.get_accounts()
@@ -1958,6 +1962,7 @@ class Chain(ABC):
     @check_connected
     def reset(self) -> None:
         self._chain_interface.reset()
+        self._tx_outputs_cache.clear()
 
     @check_connected
     def update_accounts(self):
@@ -2342,6 +2347,21 @@ class Chain(ABC):
         generated_error.tx = tx
         return generated_error
 
+    def _get_tx_output(
+        self, key: Tuple[str, str, str], compute: Callable[[], list]
+    ) -> list:
+        # the same transaction (hash) may be re-executed after a snapshot revert,
+        # so the key must also contain the hash of the block it was mined in
+        try:
+            ret = self._tx_outputs_cache.pop(key)
+        except KeyError:
+            ret = tuple(compute())
+            if len(self._tx_outputs_cache) >= TX_OUTPUTS_CACHE_SIZE:
+                del self._tx_outputs_cache[next(iter(self._tx_outputs_cache))]
+        self._tx_outputs_cache[key] = ret
+        # a new list for every caller, so that mutations do not leak into the cache
+        return list(ret)
+
     def _process_events(self, tx: TransactionAbc) -> list:
         fqn_overrides: ChainMap[Address, Optional[str]] = ChainMap()
         generated_events = []
@@ -28,7 +28,6 @@ from urllib.request import pathname2url
 import eth_utils
 import networkx as nx
 from Crypto.Hash import BLAKE2b, keccak
-from intervaltree import IntervalTree
 from typing_extensions import Literal
 
 import wake.ir.types as types
@@ -56,6 +55,7 @@ from wake.ir import (
 from wake.ir.enums import ContractKind, FunctionKind, StateMutability, Visibility
 from wake.ir.reference_resolver import ReferenceResolver
 from wake.utils import get_package_version
+from wake.utils.interval_index import IntervalIndex
 
 from .constants import DEFAULT_IMPORTS, INIT_CONTENT, TAB_WIDTH
 
@@ -156,7 +156,7 @@ class TypeGenerator:
     # used to avoid generating the same contract multiple times, eg. when multiple contracts inherit from it
     __already_generated_contracts: Set[str]
     __source_units: Dict[Path, SourceUnit]
-    __interval_trees: Dict[Path, IntervalTree]
+    __interval_trees: Dict[Path, IntervalIndex]
     __reference_resolver: ReferenceResolver
     __imports: SourceUnitImports
     __name_sanitizer: NameSanitizer
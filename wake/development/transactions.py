@@ -63,25 +63,15 @@ class TransactionTypeEnum(IntEnum):
     EIP1559 = 2
 
 
-def _fetch_tx_data(f):
-    @functools.wraps(f)
-    def wrapper(self: TransactionAbc):
-        if self._tx_data is None:
-            self._tx_data = self._chain.chain_interface.get_transaction(self.tx_hash)
-        return f(self)
-
-    return wrapper
-
+# int(val, 16) accepts the 0x prefix and is faster than int.from_bytes(bytes.fromhex(...))
+# even for 32-byte values, which would also need zero-padding for odd-length quantities
+def _hex_int(val: str) -> int:
+    return int(val, 16)
 
-def _fetch_tx_receipt(f):
-    @functools.wraps(f)
-    def wrapper(self: TransactionAbc):
-        if self._tx_receipt is None:
-            self.wait()
-        assert self._tx_receipt is not None
-        return f(self)
 
-    return wrapper
+def _strip_hex_prefix(val: str) -> str:
+    # JSON-RPC DATA values are 0x-prefixed, but not all clients follow the spec
+    return val[2:] if val[1:2] == "x" else val
 
 
 class ChainTransactions:
@@ -189,6 +179,30 @@ class ChainTransactions:
 
 
 class TransactionAbc(ABC, Generic[T]):
+    __slots__ = (
+        "_tx_hash",
+        "_tx_params",
+        "_chain",
+        "_abi",
+        "_return_type",
+        "_tx_data",
+        "_tx_receipt",
+        "_status",
+        "_trace_transaction",
+        "_debug_trace_transaction",
+        "_error",
+        "_raw_error",
+        "_events",
+        # parsed from tx data/receipt on first access
+        "_block_number",
+        "_tx_index",
+        "_r",
+        "_s",
+        "_gas_used",
+        "_cumulative_gas_used",
+        "_effective_gas_price",
+    )
+
     _tx_hash: str
     _tx_params: TxParams
     _chain: Chain
@@ -196,12 +210,34 @@ class TransactionAbc(ABC, Generic[T]):
     _return_type: Type
     _tx_data: Optional[Dict[str, Any]]
     _tx_receipt: Optional[Dict[str, Any]]
+    _status: Optional[TransactionStatusEnum]
     _trace_transaction: Optional[List[Dict[str, Any]]]
-    _debug_trace_transaction = Optional[Dict[str, Any]]
+    _debug_trace_transaction: Optional[Dict[str, Any]]
     _error: Optional[TransactionRevertedError]
     _raw_error: Optional[UnknownTransactionRevertedError]
     _events: Optional[List]
 
+    _block_number: int
+    _tx_index: int
+    _r: int
+    _s: int
+    _gas_used: int
+    _cumulative_gas_used: int
+    _effective_gas_price: Wei
+
+    # slot name -> (RPC response key, parser)
+    _TX_DATA_FIELDS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+        "_r": ("r", _hex_int),
+        "_s": ("s", _hex_int),
+    }
+    _TX_RECEIPT_FIELDS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+        "_block_number": ("blockNumber", _hex_int),
+        "_tx_index": ("transactionIndex", _hex_int),
+        "_gas_used": ("gasUsed", _hex_int),
+        "_cumulative_gas_used": ("cumulativeGasUsed", _hex_int),
+        "_effective_gas_price": ("effectiveGasPrice", lambda v: Wei(_hex_int(v))),
+    }
+
     def __init__(
         self,
         tx_hash: str,
@@ -218,33 +254,110 @@ class TransactionAbc(ABC, Generic[T]):
 
         self._tx_data = None
         self._tx_receipt = None
+        self._status = None
         self._trace_transaction = None
         self._debug_trace_transaction = None
         self._error = None
         self._raw_error = None
         self._events = None
 
+    def _materialize_tx_data(self) -> None:
+        assert self._tx_data is not None
+        data = self._tx_data
+        for name, (key, parser) in self._TX_DATA_FIELDS.items():
+            if data.get(key) is not None:
+                setattr(self, name, parser(data[key]))
+
+    def _materialize_tx_receipt(self) -> None:
+        assert self._tx_receipt is not None
+        receipt = self._tx_receipt
+        for name, (key, parser) in self._TX_RECEIPT_FIELDS.items():
+            if receipt.get(key) is not None:
+                setattr(self, name, parser(receipt[key]))
+
+    def _missing_field(self, name: str) -> KeyError:
+        # the field was not present in the RPC response, report the missing key
+        key, _ = {**self._TX_DATA_FIELDS, **self._TX_RECEIPT_FIELDS}[name]
+        return KeyError(key)
+
+    def _fetch_tx_data(self) -> None:
+        if self._tx_data is None:
+            self._tx_data = self._chain.chain_interface.get_transaction(self._tx_hash)
+            self._materialize_tx_data()
+
+    def _fetch_tx_receipt(self) -> None:
+        if self._tx_receipt is None:
+            self.wait()
+        assert self._tx_receipt is not None
+
     @property
     def tx_hash(self) -> str:
         return self._tx_hash
 
+    @property
+    def block_number(self) -> int:
+        self._fetch_tx_receipt()
+        try:
+            return self._block_number
+        except AttributeError:
+            raise self._missing_field("_block_number") from None
+
+    @property
+    def tx_index(self) -> int:
+        self._fetch_tx_receipt()
+        try:
+            return self._tx_index
+        except AttributeError:
+            raise self._missing_field("_tx_index") from None
+
+    @property
+    def r(self) -> int:
+        self._fetch_tx_data()
+        try:
+            return self._r
+        except AttributeError:
+            raise self._missing_field("_r") from None
+
+    @property
+    def s(self) -> int:
+        self._fetch_tx_data()
+        try:
+            return self._s
+        except AttributeError:
+            raise self._missing_field("_s") from None
+
+    @property
+    def gas_used(self) -> int:
+        self._fetch_tx_receipt()
+        try:
+            return self._gas_used
+        except AttributeError:
+            raise self._missing_field("_gas_used") from None
+
+    @property
+    def cumulative_gas_used(self) -> int:
+        self._fetch_tx_receipt()
+        try:
+            return self._cumulative_gas_used
+        except AttributeError:
+            raise self._missing_field("_cumulative_gas_used") from None
+
+    @property
+    def effective_gas_price(self) -> Wei:
+        self._fetch_tx_receipt()
+        try:
+            return self._effective_gas_price
+        except AttributeError:
+            raise self._missing_field("_effective_gas_price") from None
+
     @property
     def chain(self) -> Chain:
         return self._chain
 
     @property
-    @_fetch_tx_receipt
     def block(self) -> Block:
         return self._chain.blocks[self.block_number]
 
-    @property
-    @_fetch_tx_receipt
-    def block_number(self) -> int:
-        return int(
-            self._tx_receipt["blockNumber"],  # pyright: ignore reportOptionalSubscript
-            16,
-        )
-
     @property
     def data(self) -> bytes:
         return self._tx_params["data"] if "data" in self._tx_params else b""
@@ -274,16 +387,6 @@ class TransactionAbc(ABC, Generic[T]):
             "nonce"
         ]  # pyright: ignore reportTypedDictNotRequiredAccess
 
-    @property
-    @_fetch_tx_receipt
-    def tx_index(self) -> int:
-        return int(
-            self._tx_receipt[  # pyright: ignore reportOptionalSubscript
-                "transactionIndex"
-            ],
-            16,
-        )
-
     @property
     def value(self) -> Wei:
         return Wei(
@@ -291,57 +394,27 @@ class TransactionAbc(ABC, Generic[T]):
         )
 
     @property
-    @_fetch_tx_data
-    def r(self) -> int:
-        return int(self._tx_data["r"], 16)  # pyright: ignore reportOptionalSubscript
-
-    @property
-    @_fetch_tx_data
-    def s(self) -> int:
-        return int(self._tx_data["s"], 16)  # pyright: ignore reportOptionalSubscript
-
-    @property
-    @_fetch_tx_receipt
-    def gas_used(self) -> int:
-        return int(
-            self._tx_receipt["gasUsed"], 16  # pyright: ignore reportOptionalSubscript
-        )
-
-    @property
-    @_fetch_tx_receipt
-    def cumulative_gas_used(self) -> int:
-        return int(
-            self._tx_receipt[  # pyright: ignore reportOptionalSubscript
-                "cumulativeGasUsed"
-            ],
-            16,
-        )
+    def status(self) -> TransactionStatusEnum:
+        return self._fetch_status()
 
-    @property
-    @_fetch_tx_receipt
-    def effective_gas_price(self) -> Wei:
-        return Wei(
-            int(
-                self._tx_receipt[  # pyright: ignore reportOptionalSubscript
-                    "effectiveGasPrice"
-                ],
-                16,
-            )
-        )
+    def _fetch_status(self) -> TransactionStatusEnum:
+        if self._status is not None:
+            return self._status
 
-    @property
-    def status(self) -> TransactionStatusEnum:
         if self._tx_receipt is None:
             receipt = self._chain.chain_interface.get_transaction_receipt(self._tx_hash)
             if receipt is None:
                 return TransactionStatusEnum.PENDING
             else:
                 self._tx_receipt = receipt
+                self._materialize_tx_receipt()
 
+        # status of a mined transaction is final
         if int(self._tx_receipt["status"], 16) == 0:
-            return TransactionStatusEnum.FAILURE
+            self._status = TransactionStatusEnum.FAILURE
         else:
-            return TransactionStatusEnum.SUCCESS
+            self._status = TransactionStatusEnum.SUCCESS
+        return self._status
 
     def wait(self, confirmations: Optional[int] = None) -> None:
         self._chain._wait_for_transaction(self, confirmations)
@@ -361,8 +434,16 @@ class TransactionAbc(ABC, Generic[T]):
             )
 
     @property
-    @_fetch_tx_receipt
     def console_logs(self) -> list:
+        self._fetch_tx_receipt()
+        assert self._tx_receipt is not None
+
+        return self._chain._get_tx_output(
+            (self._tx_hash, self._tx_receipt["blockHash"], "console_logs"),
+            self._process_console_logs,
+        )
+
+    def _process_console_logs(self) -> list:
         chain_interface = self._chain.chain_interface
 
         if isinstance(chain_interface, AnvilChainInterface):
@@ -399,8 +480,8 @@ class TransactionAbc(ABC, Generic[T]):
             raise NotImplementedError
 
     @property
-    @_fetch_tx_receipt
     def events(self) -> list:
+        self._fetch_tx_receipt()
         if self._events is not None:
             return self._events
 
@@ -410,31 +491,54 @@ class TransactionAbc(ABC, Generic[T]):
             self._events = []
             return self._events
 
-        self._events = self._chain._process_events(self)
+        self._events = self._chain._get_tx_output(
+            (self._tx_hash, self._tx_receipt["blockHash"], "events"),
+            lambda: self._chain._process_events(self),
+        )
         return self._events
 
     @property
-    @_fetch_tx_receipt
     def raw_events(self) -> List[UnknownEvent]:
+        self._fetch_tx_receipt()
         assert self._tx_receipt is not None
 
-        ret = []
-        for log in self._tx_receipt["logs"]:
-            topics = [
-                bytes.fromhex(t[2:]) if t.startswith("0x") else bytes.fromhex(t)
-                for t in log["topics"]
-            ]
-            data = (
-                bytes.fromhex(log["data"][2:])
-                if log["data"].startswith("0x")
-                else bytes.fromhex(log["data"])
+        fromhex = bytes.fromhex
+        return [
+            UnknownEvent(
+                [fromhex(_strip_hex_prefix(t)) for t in log["topics"]],
+                fromhex(_strip_hex_prefix(log["data"])),
             )
-            ret.append(UnknownEvent(topics, data))
-        return ret
+            for log in self._tx_receipt["logs"]
+        ]
+
+    # helpers used by ChainInterfaceAbc._extract_return_data/_extract_revert_data implementations
+    def _output_from_trace(self) -> bytes:
+        self._fetch_trace_transaction()
+        assert self._trace_transaction is not None
+        return bytes.fromhex(
+            _strip_hex_prefix(self._trace_transaction[0]["result"]["output"])
+        )
+
+    def _output_from_debug_trace(self) -> bytes:
+        self._fetch_debug_trace_transaction()
+        assert self._debug_trace_transaction is not None
+        return bytes.fromhex(self._debug_trace_transaction["returnValue"])  # type: ignore
+
+    def _output_from_struct_logs(self, op: str) -> bytes:
+        self._fetch_debug_trace_transaction()
+        assert self._debug_trace_transaction is not None
+        struct_logs: Any = self._debug_trace_transaction["structLogs"]  # type: ignore
+
+        if len(struct_logs) == 0 or struct_logs[-1]["op"] != op:
+            return b""
+        trace = struct_logs[-1]
+        offset = int(trace["stack"][-1], 16)
+        length = int(trace["stack"][-2], 16)
+        return bytes(read_from_memory(offset, length, trace["memory"]))
 
     @property
-    @_fetch_tx_receipt
     def error(self) -> Optional[TransactionRevertedError]:
+        self._fetch_tx_receipt()
         if self.status == TransactionStatusEnum.SUCCESS:
             return None
 
@@ -448,70 +552,23 @@ class TransactionAbc(ABC, Generic[T]):
         return self._error
 
     @property
-    @_fetch_tx_receipt
     def raw_error(self) -> Optional[UnknownTransactionRevertedError]:
+        self._fetch_tx_receipt()
         if self.status == TransactionStatusEnum.SUCCESS:
             return None
 
         if self._raw_error is not None:
             return self._raw_error
 
-        chain_interface = self._chain.chain_interface
-
-        assert self._tx_receipt is not None
-        # due to a bug, Anvil does not return revert data for failed contract creations
-        if isinstance(chain_interface, AnvilChainInterface) and self.to is not None:
-            self._fetch_trace_transaction()
-            assert self._trace_transaction is not None
-            output = self._trace_transaction[0]["result"]["output"]
-            if output.startswith("0x"):
-                output = output[2:]
-            revert_data = bytes.fromhex(output)
-        elif isinstance(chain_interface, (AnvilChainInterface, GanacheChainInterface)):
-            self._fetch_debug_trace_transaction()
-            assert self._debug_trace_transaction is not None
-
-            if len(self._debug_trace_transaction["structLogs"]) == 0 or self._debug_trace_transaction["structLogs"][-1]["op"] != "REVERT":  # type: ignore
-                revert_data = b""
-            else:
-                trace: Any = self._debug_trace_transaction["structLogs"][-1]  # type: ignore
-                offset = int(trace["stack"][-1], 16)
-                length = int(trace["stack"][-2], 16)
-
-                revert_data = bytes(read_from_memory(offset, length, trace["memory"]))
-        elif isinstance(chain_interface, HardhatChainInterface):
-            self._fetch_debug_trace_transaction()
-            assert self._debug_trace_transaction is not None
-            revert_data = bytes.fromhex(self._debug_trace_transaction["returnValue"])  # type: ignore
-        elif isinstance(chain_interface, GethLikeChainInterfaceAbc):
-            try:
-                self._fetch_trace_transaction()
-                assert self._trace_transaction is not None
-                output = self._trace_transaction[0]["result"]["output"]
-                if output.startswith("0x"):
-                    output = output[2:]
-                revert_data = bytes.fromhex(output)
-            except (JsonRpcError, HTTPError):
-                # TODO make assertions about error.code?
-                try:
-                    self._fetch_debug_trace_transaction()
-                    assert self._debug_trace_transaction is not None
-                    revert_data = bytes.fromhex(self._debug_trace_transaction["returnValue"])  # type: ignore
-                except (JsonRpcError, HTTPError):
-                    # TODO make assertions about error.code?
-                    raise RuntimeError(
-                        f"Could not get revert reason data for transaction {self.tx_hash} as trace_transaction and debug_trace_transaction are both unavailable"
-                    )
-        else:
-            raise NotImplementedError
+        revert_data = self._chain.chain_interface._extract_revert_data(self)
 
         self._raw_error = UnknownTransactionRevertedError(revert_data)
         self._raw_error.tx = self
         return self._raw_error
 
     @property
-    @_fetch_tx_receipt
     def return_value(self) -> T:
+        self._fetch_tx_receipt()
         raw_value = self.raw_return_value
 
         if self._return_type is type(None):
@@ -532,8 +589,8 @@ class TransactionAbc(ABC, Generic[T]):
             )
 
     @property
-    @_fetch_tx_receipt
     def raw_return_value(self) -> Union[Account, bytearray]:
+        self._fetch_tx_receipt()
         if self.status != TransactionStatusEnum.SUCCESS:
             e = self.error
             assert e is not None
@@ -546,58 +603,12 @@ class TransactionAbc(ABC, Generic[T]):
         ):
             return Account(self._tx_receipt["contractAddress"], self._chain)
 
-        chain_interface = self._chain.chain_interface
-        if isinstance(chain_interface, AnvilChainInterface):
-            self._fetch_trace_transaction()
-            assert self._trace_transaction is not None
-            o = self._trace_transaction[0]["result"]["output"]
-            if o.startswith("0x"):
-                o = o[2:]
-            output = bytes.fromhex(o)
-        elif isinstance(chain_interface, GanacheChainInterface):
-            self._fetch_debug_trace_transaction()
-            assert self._debug_trace_transaction is not None
-
-            if len(self._debug_trace_transaction["structLogs"]) == 0 or self._debug_trace_transaction["structLogs"][-1]["op"] != "RETURN":  # type: ignore
-                output = b""
-            else:
-                trace: Any = self._debug_trace_transaction["structLogs"][-1]  # type: ignore
-                offset = int(trace["stack"][-1], 16)
-                length = int(trace["stack"][-2], 16)
-
-                output = read_from_memory(offset, length, trace["memory"])
-        elif isinstance(chain_interface, HardhatChainInterface):
-            self._fetch_debug_trace_transaction()
-            assert self._debug_trace_transaction is not None
-            output = bytes.fromhex(self._debug_trace_transaction["returnValue"])  # type: ignore
-        elif isinstance(chain_interface, GethLikeChainInterfaceAbc):
-            try:
-                self._fetch_trace_transaction()
-                assert self._trace_transaction is not None
-                o = self._trace_transaction[0]["result"]["output"]
-                if o.startswith("0x"):
-                    o = o[2:]
-                output = bytes.fromhex(o)
-            except (JsonRpcError, HTTPError):
-                # TODO make assertions about error.code?
-                try:
-                    self._fetch_debug_trace_transaction()
-                    assert self._debug_trace_transaction is not None
-                    output = bytes.fromhex(self._debug_trace_transaction["returnValue"])  # type: ignore
-                except (JsonRpcError, HTTPError):
-                    # TODO make assertions about error.code?
-                    raise RuntimeError(
-                        f"Could not get return value for transaction {self.tx_hash} as trace_transaction and debug_trace_transaction are both unavailable"
-                    )
-        else:
-            raise NotImplementedError
-
-        return bytearray(output)
+        return bytearray(self._chain.chain_interface._extract_return_data(self))
 
     @property
-    @_fetch_tx_data
-    @_fetch_tx_receipt
     def call_trace(self) -> CallTrace:
+        self._fetch_tx_data()
+        self._fetch_tx_receipt()
         if self._debug_trace_transaction is None:
             self._fetch_debug_trace_transaction()
         assert self._debug_trace_transaction is not None
@@ -617,10 +628,22 @@ class TransactionAbc(ABC, Generic[T]):
 
 
 class LegacyTransaction(TransactionAbc[T]):
+    __slots__ = ("_v",)
+
+    _v: int
+
+    _TX_DATA_FIELDS = {
+        **TransactionAbc._TX_DATA_FIELDS,
+        "_v": ("v", _hex_int),
+    }
+
     @property
-    @_fetch_tx_data
     def v(self) -> int:
-        return int(self._tx_data["v"], 16)  # pyright: ignore reportOptionalSubscript
+        self._fetch_tx_data()
+        try:
+            return self._v
+        except AttributeError:
+            raise self._missing_field("_v") from None
 
     @property
     def gas_price(self) -> Wei:
@@ -633,6 +656,23 @@ class LegacyTransaction(TransactionAbc[T]):
 
 
 class Eip2930Transaction(TransactionAbc[T]):
+    __slots__ = ("_y_parity",)
+
+    _y_parity: bool
+
+    _TX_DATA_FIELDS = {
+        **TransactionAbc._TX_DATA_FIELDS,
+        "_y_parity": ("v", lambda v: bool(_hex_int(v) & 1)),
+    }
+
+    @property
+    def y_parity(self) -> bool:
+        self._fetch_tx_data()
+        try:
+            return self._y_parity
+        except AttributeError:
+            raise self._missing_field("_y_parity") from None
+
     @property
     def chain_id(self) -> int:
         assert "chainId" in self._tx_params
@@ -654,13 +694,6 @@ class Eip2930Transaction(TransactionAbc[T]):
         assert "gasPrice" in self._tx_params
         return Wei(self._tx_params["gasPrice"])
 
-    @property
-    @_fetch_tx_data
-    def y_parity(self) -> bool:
-        return bool(
-            int(self._tx_data["v"], 16) & 1  # pyright: ignore reportOptionalSubscript
-        )
-
     @property
     def type(self) -> TransactionTypeEnum:
         assert "type" in self._tx_params and self._tx_params["type"] == 1
@@ -668,6 +701,23 @@ class Eip2930Transaction(TransactionAbc[T]):
 
 
 class Eip1559Transaction(TransactionAbc[T]):
+    __slots__ = ("_y_parity",)
+
+    _y_parity: bool
+
+    _TX_DATA_FIELDS = {
+        **TransactionAbc._TX_DATA_FIELDS,
+        "_y_parity": ("v", lambda v: bool(_hex_int(v) & 1)),
+    }
+
+    @property
+    def y_parity(self) -> bool:
+        self._fetch_tx_data()
+        try:
+            return self._y_parity
+        except AttributeError:
+            raise self._missing_field("_y_parity") from None
+
     @property
     def chain_id(self) -> int:
         assert "chainId" in self._tx_params
@@ -676,20 +726,16 @@ class Eip1559Transaction(TransactionAbc[T]):
     @property
     def max_fee_per_gas(self) -> Wei:
         if "maxFeePerGas" not in self._tx_params:
-            if self._tx_data is None:
-                self._tx_data = self._chain.chain_interface.get_transaction(
-                    self.tx_hash
-                )
+            self._fetch_tx_data()
+            assert self._tx_data is not None
             return Wei(int(self._tx_data["maxFeePerGas"], 16))
         return Wei(self._tx_params["maxFeePerGas"])
 
     @property
     def max_priority_fee_per_gas(self) -> Wei:
         if "maxPriorityFeePerGas" not in self._tx_params:
-            if self._tx_data is None:
-                self._tx_data = self._chain.chain_interface.get_transaction(
-                    self.tx_hash
-                )
+            self._fetch_tx_data()
+            assert self._tx_data is not None
             return Wei(int(self._tx_data["maxPriorityFeePerGas"], 16))
         return Wei(self._tx_params["maxPriorityFeePerGas"])
 
@@ -704,13 +750,6 @@ class Eip1559Transaction(TransactionAbc[T]):
             ret[account].append(entry[1])
         return ret
 
-    @property
-    @_fetch_tx_data
-    def y_parity(self) -> bool:
-        return bool(
-            int(self._tx_data["v"], 16) & 1  # pyright: ignore reportOptionalSubscript
-        )
-
     @property
     def type(self) -> TransactionTypeEnum:
         assert "type" in self._tx_params and self._tx_params["type"] == 2
@@ -79,7 +79,7 @@ class IrAbc(ABC):
         The depth of this node in the AST tree. The root node ([Source unit][wake.ir.meta.source_unit.SourceUnit]) of each file has depth 0. Direct child nodes of a `node` have depth `{node}.ast_tree_depth + 1`.
 
         !!! tip
-            Wake uses [interval trees](https://github.com/chaimleib/intervaltree) to get a list of all IR nodes at a given byte offset in a given file. This property can be used to sort these nodes by their depth in the AST tree and (for example) to choose the most nested one.
+            Wake uses [interval indexes][wake.compiler.build_data_model.ProjectBuild.interval_trees] to get a list of all IR nodes at a given byte offset in a given file. This property can be used to sort these nodes by their depth in the AST tree and (for example) to choose the most nested one.
 
         Returns:
             Depth of this node in the AST tree, starting from 0.
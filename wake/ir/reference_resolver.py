@@ -16,11 +16,10 @@ from typing import (
     Union,
 )
 
-from intervaltree import IntervalTree
-
 from wake.core import get_logger
 from wake.ir.ast import AstNodeId, AstSolc
 from wake.ir.enums import GlobalSymbol
+from wake.utils.interval_index import IntervalIndex
 
 if TYPE_CHECKING:
     from wake.ir.abc import SolidityAbc
@@ -34,7 +33,7 @@ logger = get_logger(__name__)
 
 @dataclass
 class CallbackParams:
-    interval_trees: Dict[Path, IntervalTree]
+    interval_trees: Dict[Path, IntervalIndex]
     source_units: Dict[Path, SourceUnit]
 
 
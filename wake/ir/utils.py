@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Optional
 
-from intervaltree import IntervalTree
+from wake.utils.interval_index import IntervalIndex
 
 if TYPE_CHECKING:
     from wake.compiler import SolcOutputContractInfo
@@ -19,7 +19,7 @@ class IrInitTuple:
     file: Path
     source: bytes
     cu: CompilationUnit
-    interval_tree: IntervalTree
+    interval_tree: IntervalIndex
     reference_resolver: ReferenceResolver
     contracts_info: Optional[Dict[str, SolcOutputContractInfo]]
     source_unit: Optional[SourceUnit] = None
@@ -84,6 +84,7 @@ from wake.lsp.document_sync import (
     DidOpenTextDocumentParams,
 )
 from wake.lsp.utils.uri import path_to_uri, uri_to_path
+from wake.utils.interval_index import IntervalIndex
 
 from ..svm import SolcVersionManager
 from .common_structures import (
@@ -205,9 +206,9 @@ class LspCompiler:
     __output_contents: Dict[Path, VersionedFile]
     __compilation_errors: Dict[Path, Set[Diagnostic]]
     __last_successful_compilation_contents: Dict[Path, VersionedFile]
-    __interval_trees: Dict[Path, IntervalTree]
+    __interval_trees: Dict[Path, IntervalIndex]
     __source_units: Dict[Path, SourceUnit]
-    __last_compilation_interval_trees: Dict[Path, IntervalTree]
+    __last_compilation_interval_trees: Dict[Path, IntervalIndex]
     __last_compilation_source_units: Dict[Path, SourceUnit]
     __last_graph: nx.DiGraph
     __last_build_settings: SolcInputSettings
@@ -492,7 +493,7 @@ class LspCompiler:
         return self.__ir_reference_resolver
 
     @property
-    def interval_trees(self) -> Dict[Path, IntervalTree]:
+    def interval_trees(self) -> Dict[Path, IntervalIndex]:
         return self.__interval_trees
 
     @property
@@ -546,7 +547,7 @@ class LspCompiler:
         )
 
     @property
-    def last_compilation_interval_trees(self) -> Dict[Path, IntervalTree]:
+    def last_compilation_interval_trees(self) -> Dict[Path, IntervalIndex]:
         return self.__last_compilation_interval_trees
 
     @property
@@ -1269,7 +1270,7 @@ class LspCompiler:
                     continue
                 processed_files.add(path)
 
-                interval_tree = IntervalTree()
+                interval_tree = IntervalIndex()
                 init = IrInitTuple(
                     path,
                     self.get_compiled_file(path).text.encode("utf-8"),
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from contextlib import contextmanager
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
@@ -300,14 +301,20 @@ class Chain(wake.development.core.Chain):
         elif confirmations is None:
             confirmations = self.default_tx_confirmations
 
-        while tx.status == TransactionStatusEnum.PENDING:
-            pass
+        # exponential backoff so that slowly mined txs do not flood the chain with RPC requests
+        delay = 0.001
+        while tx._fetch_status() == TransactionStatusEnum.PENDING:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
 
         if confirmations == 1:
             return
 
-        while self.blocks["latest"].number - tx.block_number < confirmations - 1:
-            pass
+        block_number = tx.block_number
+        delay = 0.001
+        while self.blocks["latest"].number - block_number < confirmations - 1:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
 
     def _confirm_transaction(self, tx: TxParams) -> None:
         pass
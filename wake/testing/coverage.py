@@ -11,8 +11,6 @@ from dataclasses import asdict, dataclass, field
 from itertools import chain
 from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple, Union
 
-from intervaltree import IntervalTree
-
 from wake.cli.console import console
 from wake.compiler import SolidityCompiler
 from wake.compiler.build_data_model import ProjectBuild
@@ -47,6 +45,7 @@ from wake.ir import (
     YulSwitch,
 )
 from wake.ir.reference_resolver import ReferenceResolver
+from wake.utils.interval_index import IntervalIndex
 
 logger = get_logger(__name__, logging.ERROR)
 
@@ -337,7 +336,7 @@ def returning_none():
 class CoverageHandler:
     _pc_maps: Dict[str, Dict[int, SourceMapPcRecord]]
     _pc_maps_undeployed: Dict[str, Dict[int, SourceMapPcRecord]]
-    _interval_trees: Dict[pathlib.Path, IntervalTree]
+    _interval_trees: Dict[pathlib.Path, IntervalIndex]
     _lines_index: Dict[pathlib.Path, List[Tuple[bytes, int]]]
     _statement_coverage: DefaultDict[Union[StatementAbc, YulStatementAbc], int]
     _function_coverage: DefaultDict[FunctionDefinition, int]
@@ -0,0 +1,264 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from intervaltree import Interval
+
+# (lo, hi, max_length) range of a length bucket in the flat arrays
+_Bucket = Tuple[int, int, int]
+
+_begin_key = attrgetter("begin")
+
+
+class IntervalIndex:
+    """
+    Read-mostly replacement for [IntervalTree](https://github.com/chaimleib/intervaltree) implementing a subset of its interface:
+
+    - insertion (`tree[begin:end] = data`, `add`, `addi`, `update`) and removal (`remove`, `removei`, `discard`, `discardi`),
+    - queries (`at`, `overlap`, `envelop`, `overlaps`, `overlaps_point`, `overlaps_range`, slicing),
+    - set-like access (`in`, `containsi`, `items`, `is_empty`, `len`, iteration, `begin`, `end`, `span`, `copy`).
+
+    Like in IntervalTree, equal intervals are stored only once. Other IntervalTree methods (e.g. `chop`, `merge_*`, `split_overlaps`
+    or set operations) are not available.
+
+    Intervals are grouped by length (lengths within a group differ at most 4 times) and stored in flat parallel arrays of begin
+    and end offsets, where every group occupies a contiguous range sorted by begin offsets. A query bisects each group range
+    and only scans back over intervals long enough to reach the queried offset. This keeps queries cheap even though IR node
+    intervals are nested (a source unit spans the whole file).
+
+    Inserting intervals invalidates the sorted arrays; they are rebuilt lazily on the next query.
+    """
+
+    _intervals: List[Interval]
+    _interval_set: Set[Interval]
+    _begins: array
+    _ends: array
+    _buckets: List[_Bucket]
+    _dirty: bool
+
+    def __init__(self, intervals: Optional[Iterable[Interval]] = None):
+        self._intervals = []
+        self._interval_set = set()
+        self._begins = array("q")
+        self._ends = array("q")
+        self._buckets = []
+        self._dirty = False
+
+        if intervals is not None:
+            for interval in intervals:
+                self.add(interval)
+
+    def add(self, interval: Interval) -> None:
+        if interval in self._interval_set:
+            return
+        if interval.begin >= interval.end:
+            raise ValueError(
+                f"IntervalIndex: Null Interval objects not allowed: {interval}"
+            )
+        self._intervals.append(interval)
+        self._interval_set.add(interval)
+        self._dirty = True
+
+    def addi(self, begin: int, end: int, data: Any = None) -> None:
+        self.add(Interval(begin, end, data))
+
+    def update(self, intervals: Iterable[Interval]) -> None:
+        for interval in intervals:
+            self.add(interval)
+
+    def remove(self, interval: Interval) -> None:
+        """
+        Raises:
+            ValueError: If the interval is not present.
+        """
+        if interval not in self._interval_set:
+            raise ValueError(interval)
+        self._interval_set.remove(interval)
+        self._intervals.remove(interval)
+        self._dirty = True
+
+    def removei(self, begin: int, end: int, data: Any = None) -> None:
+        self.remove(Interval(begin, end, data))
+
+    def discard(self, interval: Interval) -> None:
+        if interval in self._interval_set:
+            self.remove(interval)
+
+    def discardi(self, begin: int, end: int, data: Any = None) -> None:
+        self.discard(Interval(begin, end, data))
+
+    def __setitem__(self, index: slice, value: Any) -> None:
+        self.addi(index.start, index.stop, value)
+
+    def _build(self) -> None:
+        self._intervals.sort(key=_begin_key)
+
+        groups: Dict[int, List[Interval]] = {}
+        for interval in self._intervals:
+            length = interval.end - interval.begin
+            groups.setdefault(length.bit_length() >> 1, []).append(interval)
+
+        self._intervals = []
+        self._buckets = []
+        for intervals in groups.values():
+            lo = len(self._intervals)
+            self._intervals.extend(intervals)
+            self._buckets.append(
+                (
+                    lo,
+                    len(self._intervals),
+                    max(interval.end - interval.begin for interval in intervals),
+                )
+            )
+
+        self._begins = array("q", [interval.begin for interval in self._intervals])
+        self._ends = array("q", [interval.end for interval in self._intervals])
+        self._dirty = False
+
+    def at(self, point: int) -> Set[Interval]:
+        """
+        Args:
+            point: Offset to query.
+
+        Returns:
+            Set of all intervals containing the given offset.
+        """
+        if self._dirty:
+            self._build()
+
+        begins = self._begins
+        ends = self._ends
+        intervals = self._intervals
+        ret = set()
+        for lo, hi, max_length in self._buckets:
+            i = bisect_right(begins, point, lo, hi) - 1
+            min_begin = point - max_length
+            while i >= lo and begins[i] > min_begin:
+                if ends[i] > point:
+                    ret.add(intervals[i])
+                i -= 1
+        return ret
+
+    def overlap(self, begin: int, end: int) -> Set[Interval]:
+        """
+        Args:
+            begin: Start of the queried range (inclusive).
+            end: End of the queried range (exclusive).
+
+        Returns:
+            Set of all intervals overlapping the given range.
+        """
+        if begin >= end:
+            return set()
+        if self._dirty:
+            self._build()
+
+        begins = self._begins
+        ends = self._ends
+        intervals = self._intervals
+        ret = set()
+        for lo, hi, max_length in self._buckets:
+            i = bisect_left(begins, end, lo, hi) - 1
+            min_begin = begin - max_length
+            while i >= lo and begins[i] > min_begin:
+                if ends[i] > begin:
+                    ret.add(intervals[i])
+                i -= 1
+        return ret
+
+    def envelop(self, begin: int, end: int) -> Set[Interval]:
+        """
+        Args:
+            begin: Start of the queried range (inclusive).
+            end: End of the queried range (exclusive).
+
+        Returns:
+            Set of all intervals fully contained in the given range.
+        """
+        if begin >= end:
+            return set()
+        if self._dirty:
+            self._build()
+
+        begins = self._begins
+        ends = self._ends
+        intervals = self._intervals
+        ret = set()
+        for lo, hi, _ in self._buckets:
+            for i in range(
+                bisect_left(begins, begin, lo, hi), bisect_left(begins, end, lo, hi)
+            ):
+                if ends[i] <= end:
+                    ret.add(intervals[i])
+        return ret
+
+    def overlaps_point(self, point: int) -> bool:
+        return len(self.at(point)) > 0
+
+    def overlaps_range(self, begin: int, end: int) -> bool:
+        return len(self.overlap(begin, end)) > 0
+
+    def overlaps(self, begin: Union[int, Interval], end: Optional[int] = None) -> bool:
+        """
+        Args:
+            begin: Offset, start of the queried range or an interval.
+            end: End of the queried range (exclusive), if `begin` is a range start.
+
+        Returns:
+            Whether any interval overlaps the given offset, range or interval.
+        """
+        if isinstance(begin, Interval):
+            return self.overlaps_range(begin.begin, begin.end)
+        elif end is not None:
+            return self.overlaps_range(begin, end)
+        return self.overlaps_point(begin)
+
+    def __contains__(self, interval: Interval) -> bool:
+        return interval in self._interval_set
+
+    def containsi(self, begin: int, end: int, data: Any = None) -> bool:
+        return Interval(begin, end, data) in self._interval_set
+
+    def items(self) -> Set[Interval]:
+        return set(self._interval_set)
+
+    def is_empty(self) -> bool:
+        return len(self._intervals) == 0
+
+    def copy(self) -> "IntervalIndex":
+        return IntervalIndex(self._intervals)
+
+    def __getitem__(self, index) -> Set[Interval]:
+        if isinstance(index, slice):
+            if index.start is None and index.stop is None:
+                return set(self)
+            return self.overlap(
+                index.start if index.start is not None else self.begin(),
+                index.stop if index.stop is not None else self.end(),
+            )
+        return self.at(index)
+
+    def begin(self) -> int:
+        if self._dirty:
+            self._build()
+        return min((self._begins[lo] for lo, _, _ in self._buckets), default=0)
+
+    def end(self) -> int:
+        return max((interval.end for interval in self._intervals), default=0)
+
+    def span(self) -> int:
+        if self.is_empty():
+            return 0
+        return self.end() - self.begin()
+
+    def __iter__(self) -> Iterator[Interval]:
+        if self._dirty:
+            self._build()
+        return iter(self._intervals)
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __repr__(self) -> str:
+        return f"IntervalIndex({self._intervals!r})"